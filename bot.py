@@ -1,17 +1,23 @@
 #!/usr/bin/env python3
 """Valshi-X - Monitor and tweet large trades on Kalshi."""
 import sys
-import time
-from typing import List, Tuple
+import logging
+import asyncio
+import uvloop
 
 # Import credentials to set environment variables
 import credentials
 
 from config import Config
+from logging_setup import setup_logging
 from kalshi_client import KalshiClient
 from x_client import XClient
-from trade_monitor import TradeMonitor, Trade
-from tweet_formatter import TweetFormatter
+from trade_monitor import TradeMonitor
+from websocket_client import KalshiWebSocketClient
+from whale_handler import WhaleHandler
+
+
+logger = logging.getLogger(__name__)
 
 
 class ValshiX:
@@ -19,32 +25,26 @@ class ValshiX:
     
     def __init__(self):
         """Initialize the bot with all necessary clients."""
-        print("Initializing Valshi-X...")
-        
         # Load configuration
         Config.load_from_env()
+        setup_logging(Config.LOG_LEVEL)
+        logger.info("Initializing Valshi-X...")
         is_valid, error = Config.validate()
         
         if not is_valid:
-            print(f"Configuration error: {error}")
+            logger.error("Configuration error: %s", error)
             sys.exit(1)
         
         # Initialize clients
-        print("Connecting to Kalshi API...")
+        logger.info("Connecting to Kalshi API...")
         self.kalshi_client = KalshiClient(
             api_key_id=Config.KALSHI_API_KEY_ID,
             private_key_pem=Config.KALSHI_PRIVATE_KEY,
             base_url=Config.KALSHI_API_BASE
         )
         
-        # Test Kalshi connection
-        if not self.kalshi_client.login():
-            print("Failed to authenticate with Kalshi API")
-            sys.exit(1)
-        print("✓ Connected to Kalshi API")
-        
         # Initialize X client
-        print("Connecting to X API...")
+        logger.info("Connecting to X API...")
         self.x_client = XClient(
             api_key=Config.X_API_KEY,
             api_secret=Config.X_API_SECRET,
@@ -54,83 +54,67 @@ class ValshiX:
         
         # Test X connection
         if not self.x_client.test_connection():
-            print("Failed to connect to X API")
+            logger.error("Failed to connect to X API")
             sys.exit(1)
-        print("✓ Connected to X API")
+        logger.info("✓ Connected to X API")
         
-        # Initialize trade monitor
+        # Initialize trade monitor (REST bootstrap / reconnect fallback)
         self.trade_monitor = TradeMonitor(
             kalshi_client=self.kalshi_client,
             threshold_dollars=Config.WHALE_THRESHOLD_DOLLARS
         )
         
-        # Initialize tweet formatter
-        self.tweet_formatter = TweetFormatter()
+        # Initialize whale handler (shared with bot_websocket.py)
+        self.handler = WhaleHandler(self.kalshi_client, self.x_client)
         
-        print("✓ Bot initialized successfully!\n")
+        # Initialize WebSocket client
+        logger.info("Initializing WebSocket client...")
+        self.ws_client = KalshiWebSocketClient(self.kalshi_client)
+        self.ws_client.on_trade(self.handler.handle_trade)
+        self.ws_client.on_connect(self.backfill)
+        
+        logger.info("✓ Bot initialized successfully!")
     
-    def post_whale_trades(self, whale_trades: List[Tuple[Trade, dict]]):
-        """Post whale trades to X.
+    async def backfill(self):
+        """Catch up on trades missed while the WebSocket was down."""
+        await self.handler.backfill(
+            await self.trade_monitor.fetch_recent_trades(whales_only=True)
+        )
+    
+    async def listen(self):
+        """Authenticate, seed seen trades over REST, then listen for pushes."""
+        # Test Kalshi connection
+        if not await self.kalshi_client.login():
+            logger.error("Failed to authenticate with Kalshi API")
+            sys.exit(1)
+        logger.info("✓ Connected to Kalshi API")
         
-        Args:
-            whale_trades: List of (Trade, market_details) tuples
-        """
-        for trade, market in whale_trades:
-            try:
-                # Format the tweet
-                tweet_text = self.tweet_formatter.format_whale_tweet(trade, market)
-                
-                print(f"\nPosting tweet for {trade.ticker}:")
-                print("-" * 60)
-                print(tweet_text)
-                print("-" * 60)
-                
-                # Post to X
-                tweet_id = self.x_client.post_tweet(tweet_text)
-                
-                if tweet_id:
-                    print(f"✓ Tweet posted successfully (ID: {tweet_id})")
-                else:
-                    print("✗ Failed to post tweet")
-                
-                # Rate limiting: wait a bit between tweets
-                if len(whale_trades) > 1:
-                    time.sleep(2)
-                    
-            except Exception as e:
-                print(f"Error posting whale trade: {str(e)}")
+        # Mark trades that happened before startup as seen
+        self.handler.mark_seen(
+            await self.trade_monitor.fetch_recent_trades(whales_only=True)
+        )
+        
+        poster = asyncio.create_task(self.handler.run_poster())
+        try:
+            await self.ws_client.listen()
+        finally:
+            poster.cancel()
+            await self.kalshi_client.close()
+            await self.x_client.close()
     
     def run(self):
-        """Run the bot's main monitoring loop."""
-        print(f"Starting monitoring...")
-        print(f"Whale threshold: ${Config.WHALE_THRESHOLD_DOLLARS:,}")
-        print(f"Check interval: {Config.CHECK_INTERVAL_SECONDS}s")
-        print(f"Press Ctrl+C to stop\n")
-        
-        cycle_count = 0
+        """Run the bot's WebSocket listener."""
+        logger.info("Starting monitoring...")
+        logger.info("Whale threshold: $%s", f"{Config.WHALE_THRESHOLD_DOLLARS:,}")
+        logger.info("Press Ctrl+C to stop")
         
         try:
-            while True:
-                cycle_count += 1
-                print(f"[Cycle {cycle_count}] Checking for whale trades...")
-                
-                # Find new whale trades
-                whale_trades = self.trade_monitor.find_new_whale_trades()
-                
-                if whale_trades:
-                    print(f"✓ Found {len(whale_trades)} whale trade(s)!")
-                    self.post_whale_trades(whale_trades)
-                else:
-                    print("No new whale trades found")
-                
-                # Wait before next check
-                print(f"Waiting {Config.CHECK_INTERVAL_SECONDS}s until next check...\n")
-                time.sleep(Config.CHECK_INTERVAL_SECONDS)
-                
+            # libuv-based event loop: cheaper socket I/O and callback dispatch
+            uvloop.run(self.listen())
         except KeyboardInterrupt:
-            print("\n\nBot stopped by user. Goodbye! 👋")
+            logger.info("Bot stopped by user. Goodbye! 👋")
         except Exception as e:
-            print(f"\nFatal error: {str(e)}")
+            logger.critical("Fatal error: %s", e)
             sys.exit(1)
 
 
@@ -20,6 +20,7 @@ class Config:
     # Bot Settings
     CHECK_INTERVAL_SECONDS: int = 60
     WHALE_THRESHOLD_DOLLARS: int = 100000
+    LOG_LEVEL: str = "INFO"
     
     @classmethod
     def load_from_env(cls):
@@ -34,6 +35,7 @@ class Config:
         
         cls.CHECK_INTERVAL_SECONDS = int(os.getenv("CHECK_INTERVAL_SECONDS", "60"))
         cls.WHALE_THRESHOLD_DOLLARS = int(os.getenv("WHALE_THRESHOLD_DOLLARS", "100000"))
+        cls.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     
     @classmethod
     def validate(cls) -> tuple[bool, Optional[str]]:
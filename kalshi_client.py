@@ -1,15 +1,20 @@
 """Kalshi API client with authentication."""
 import base64
+import logging
 import time
 from typing import Dict, List, Optional
-import requests
+import httpx
+import orjson
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.backends import default_backend
 
 
+logger = logging.getLogger(__name__)
+
+
 class KalshiClient:
-    """Client for interacting with Kalshi API."""
+    """Async client for interacting with Kalshi API."""
     
     def __init__(self, api_key_id: str, private_key_pem: str, base_url: str):
         """Initialize Kalshi client with credentials.
@@ -21,7 +26,15 @@ class KalshiClient:
         """
         self.api_key_id = api_key_id
         self.base_url = base_url
-        self.session = requests.Session()
+        # One pooled HTTP/2 connection multiplexes concurrent lookups.
+        # Bodies arrive gzip-compressed; httpx inflates them into
+        # response.content, which orjson parses without a str decode.
+        self.session = httpx.AsyncClient(
+            http2=True,
+            base_url=base_url,
+            headers={'Accept-Encoding': 'gzip'},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
         
         # Load private key
         self.private_key = serialization.load_pem_private_key(
@@ -29,6 +42,19 @@ class KalshiClient:
             password=None,
             backend=default_backend()
         )
+        
+        # Headers that are identical on every request
+        self._hdr_template = {
+            'Content-Type': 'application/json',
+            'KALSHI-ACCESS-KEY': self.api_key_id
+        }
+        
+        # Signing parameters are immutable, build them once
+        self._sha = hashes.SHA256()
+        self._pss = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH
+        )
     
     def _sign_message(self, message: str) -> str:
         """Sign a message using RSA private key with PSS padding.
@@ -39,57 +65,47 @@ class KalshiClient:
         Returns:
             Base64 encoded signature
         """
-        signature = self.private_key.sign(
-            message.encode('utf-8'),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH
-            ),
-            hashes.SHA256()
-        )
-        return base64.b64encode(signature).decode('utf-8')
+        signature = self.private_key.sign(message.encode('utf-8'), self._pss, self._sha)
+        # Base64 output is pure ASCII
+        return base64.b64encode(signature).decode('ascii')
     
     def _get_auth_headers(self, method: str, path: str) -> Dict:
         """Generate authentication headers for a request.
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            path: API path (e.g., /trade-api/v2/markets)
+            path: API path without query params (e.g., /trade-api/v2/markets)
             
         Returns:
             Dictionary of authentication headers
         """
-        timestamp = str(int(time.time() * 1000))
-        
-        # Remove query params from path for signing
-        path_parts = path.split('?')
-        msg_string = timestamp + method + path_parts[0]
+        # Integer milliseconds, no float round trip
+        timestamp = str(time.time_ns() // 1_000_000)
+        msg_string = timestamp + method + path
         
         signature = self._sign_message(msg_string)
         
-        headers = {
-            'Content-Type': 'application/json',
-            'KALSHI-ACCESS-KEY': self.api_key_id,
+        return {
+            **self._hdr_template,
             'KALSHI-ACCESS-SIGNATURE': signature,
             'KALSHI-ACCESS-TIMESTAMP': timestamp
         }
-        
-        return headers
     
-    def login(self) -> bool:
+    async def login(self) -> bool:
         """Test connection to Kalshi API.
         
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            # Test with exchange status endpoint
-            result = self.get_exchange_status()
+            # Test with exchange status endpoint, signed on purpose so
+            # startup still exercises the credentials
+            result = await self._make_request('GET', '/trade-api/v2/exchange/status')
             if result:
                 return True
             return False
         except Exception as e:
-            print(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     def get_auth_token(self) -> Optional[str]:
@@ -101,59 +117,72 @@ class KalshiClient:
         try:
             # The API key itself is used for WebSocket authentication
             # Generate a signed message for WebSocket auth
-            timestamp = str(int(time.time() * 1000))
+            timestamp = str(time.time_ns() // 1_000_000)
             msg_string = timestamp + "GET" + "/trade-api/ws/v2"
             signature = self._sign_message(msg_string)
             
             # Return auth token in format: key_id:timestamp:signature
             return f"{self.api_key_id}:{timestamp}:{signature}"
         except Exception as e:
-            print(f"Failed to generate auth token: {str(e)}")
+            logger.error("Failed to generate auth token: %s", e)
             return None
     
-    def get_exchange_status(self) -> Optional[Dict]:
+    async def get_exchange_status(self) -> Optional[Dict]:
         """Get exchange status."""
-        return self._make_request('GET', '/trade-api/v2/exchange/status')
+        return await self._make_request('GET', '/trade-api/v2/exchange/status', signed=False)
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
-        """Make authenticated request to Kalshi API.
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        signed: bool = True,
+        **kwargs
+    ) -> Optional[Dict]:
+        """Make a request to Kalshi API without blocking the event loop.
         
         Args:
             method: HTTP method
             endpoint: API endpoint (e.g., /trade-api/v2/markets)
+            signed: Add RSA-PSS auth headers; public market data does not need them
             **kwargs: Additional request parameters
             
         Returns:
             Response JSON or None on error
         """
-        # Generate authentication headers
-        headers = self._get_auth_headers(method, endpoint)
+        if signed:
+            # Generate authentication headers (query params are not signed)
+            headers = self._get_auth_headers(method, endpoint.partition('?')[0])
+        else:
+            headers = {'Content-Type': 'application/json'}
         
         # Merge with any additional headers
         if 'headers' in kwargs:
             headers.update(kwargs.pop('headers'))
         
-        url = f"{self.base_url}{endpoint}"
-        
         try:
-            response = self.session.request(
+            response = await self.session.request(
                 method,
-                url,
+                endpoint,
                 headers=headers,
                 **kwargs
             )
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
-                print(f"Request failed: {response.status_code} - {response.text}")
+                logger.error("Request failed: %s - %s", response.status_code, response.text)
                 return None
                 
         except Exception as e:
-            print(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             return None
     
-    def get_markets(self, limit: int = 100, status: str = "open") -> Optional[List[Dict]]:
+    async def close(self):
+        """Close the underlying HTTP connection pool."""
+        await self.session.aclose()
+    
+    async def get_markets(self, limit: int = 100, status: str = "open") -> Optional[List[Dict]]:
         """Get list of markets.
         
         Args:
@@ -168,10 +197,10 @@ class KalshiClient:
             'status': status
         }
         
-        result = self._make_request('GET', '/trade-api/v2/markets', params=params)
+        result = await self._make_request('GET', '/trade-api/v2/markets', signed=False, params=params)
         return result.get('markets', []) if result else None
     
-    def get_market(self, ticker: str) -> Optional[Dict]:
+    async def get_market(self, ticker: str) -> Optional[Dict]:
         """Get details for a specific market.
         
         Args:
@@ -180,10 +209,10 @@ class KalshiClient:
         Returns:
             Market object or None on error
         """
-        result = self._make_request('GET', f'/trade-api/v2/markets/{ticker}')
+        result = await self._make_request('GET', f'/trade-api/v2/markets/{ticker}', signed=False)
         return result.get('market') if result else None
     
-    def get_trades(self, ticker: Optional[str] = None, limit: int = 100) -> Optional[List[Dict]]:
+    async def get_trades(self, ticker: Optional[str] = None, limit: int = 100) -> Optional[List[Dict]]:
         """Get recent trades.
         
         Args:
@@ -197,10 +226,10 @@ class KalshiClient:
         if ticker:
             params['ticker'] = ticker
         
-        result = self._make_request('GET', '/trade-api/v2/markets/trades', params=params)
+        result = await self._make_request('GET', '/trade-api/v2/markets/trades', params=params)
         return result.get('trades', []) if result else None
     
-    def get_orderbook(self, ticker: str) -> Optional[Dict]:
+    async def get_orderbook(self, ticker: str) -> Optional[Dict]:
         """Get orderbook for a market.
         
         Args:
@@ -209,6 +238,6 @@ class KalshiClient:
         Returns:
             Orderbook data or None on error
         """
-        result = self._make_request('GET', f'/trade-api/v2/markets/{ticker}/orderbook')
+        result = await self._make_request('GET', f'/trade-api/v2/markets/{ticker}/orderbook')
         return result if result else None
 
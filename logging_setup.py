@@ -0,0 +1,37 @@
+"""Logging configuration for Valshi-X."""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """Route all log records through a queue drained by a background thread.
+    
+    The root logger only enqueues records, so logging from the asyncio
+    loop never waits on stdout/journal I/O.
+    
+    Args:
+        level: Root log level name (DEBUG, INFO, ...)
+    
+    Returns:
+        The started QueueListener (stopped automatically at exit)
+    """
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level.upper())
+    
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    return listener
@@ -0,0 +1,34 @@
+"""Async token-bucket rate limiter."""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token bucket that allows bursts up to max_tokens, refilled at a fixed rate."""
+    
+    def __init__(self, rate: float, max_tokens: int):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            max_tokens: Bucket capacity (largest allowed burst)
+        """
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self.updated_at = time.monotonic()
+    
+    def add_new_tokens(self):
+        """Refill the bucket for the time elapsed since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self.updated_at) * self.rate, self.max_tokens)
+        self.updated_at = now
+    
+    async def wait_for_token(self):
+        """Wait (without blocking the event loop) until a token is available, then take it."""
+        self.add_new_tokens()
+        while self.tokens < 1:
+            # Sleep exactly until the next token is due
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self.add_new_tokens()
+        self.tokens -= 1
@@ -0,0 +1,48 @@
+"""Shared record of already-processed trade IDs."""
+from collections import OrderedDict
+
+
+# Number of most recently seen trade IDs kept for deduplication
+MAX_SEEN_TRADES = 10000
+
+
+class SeenTracker:
+    """Bounded LRU set of trade IDs, oldest evicted first."""
+    
+    def __init__(self, max_size: int = MAX_SEEN_TRADES):
+        """Initialize an empty tracker.
+        
+        Args:
+            max_size: Maximum number of trade IDs remembered
+        """
+        self.max_size = max_size
+        self._seen: OrderedDict[str, None] = OrderedDict()
+    
+    def add(self, trade_id: str) -> bool:
+        """Record a trade ID.
+        
+        Args:
+            trade_id: Trade ID
+        
+        Returns:
+            True if the trade had not been seen before
+        """
+        if trade_id in self._seen:
+            self._seen.move_to_end(trade_id)
+            return False
+        
+        self._seen[trade_id] = None
+        if len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return True
+    
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self._seen
+    
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+# Process-wide instance shared by the REST (TradeMonitor) and WebSocket
+# (WhaleHandler) paths, so switching between them never re-posts a trade
+tracker = SeenTracker()
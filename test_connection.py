@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test script to verify API connections for Valshi-X."""
 import sys
+import asyncio
 
 # Import credentials to set environment variables
 import credentials
@@ -10,7 +11,7 @@ from kalshi_client import KalshiClient
 from x_client import XClient
 
 
-def test_kalshi_connection():
+async def test_kalshi_connection():
     """Test Kalshi API connection."""
     print("Testing Kalshi API connection...")
     
@@ -23,28 +24,31 @@ def test_kalshi_connection():
             base_url=Config.KALSHI_API_BASE
         )
         
-        if client.login():
-            print("✓ Kalshi API: Connected successfully!")
-            
-            # Try fetching markets
-            markets = client.get_markets(limit=5)
-            if markets:
-                print(f"✓ Fetched {len(markets)} markets")
-                print(f"  Example: {markets[0].get('ticker', 'N/A')}")
-            
-            return True
-        else:
-            print("✗ Kalshi API: Login failed")
-            return False
+        try:
+            if await client.login():
+                print("✓ Kalshi API: Connected successfully!")
+                
+                # Try fetching markets
+                markets = await client.get_markets(limit=5)
+                if markets:
+                    print(f"✓ Fetched {len(markets)} markets")
+                    print(f"  Example: {markets[0].get('ticker', 'N/A')}")
+                
+                return True
+            else:
+                print("✗ Kalshi API: Login failed")
+                return False
+        finally:
+            await client.close()
             
     except Exception as e:
         print(f"✗ Kalshi API: Error - {str(e)}")
         return False
 
 
-def test_x_connection():
+async def test_x_connection():
     """Test X API connection."""
-    print("\nTesting X API connection...")
+    print("Testing X API connection...")
     
     try:
         Config.load_from_env()
@@ -56,7 +60,8 @@ def test_x_connection():
             access_token_secret=Config.X_ACCESS_TOKEN_SECRET
         )
         
-        if client.test_connection():
+        # tweepy is blocking; run it in a thread so the Kalshi probe overlaps
+        if await asyncio.to_thread(client.test_connection):
             print("✓ X API: Connected successfully!")
             return True
         else:
@@ -68,6 +73,21 @@ def test_x_connection():
         return False
 
 
+async def run_tests():
+    """Run the independent connection probes concurrently.
+    
+    Returns:
+        Tuple of (kalshi_ok, x_ok)
+    """
+    results = await asyncio.gather(
+        test_kalshi_connection(),
+        test_x_connection(),
+        return_exceptions=True
+    )
+    # An unexpected exception counts as a failed probe
+    return tuple(result is True for result in results)
+
+
 def main():
     """Run all connection tests."""
     print("=" * 60)
@@ -87,8 +107,7 @@ def main():
     print()
     
     # Test connections
-    kalshi_ok = test_kalshi_connection()
-    x_ok = test_x_connection()
+    kalshi_ok, x_ok = asyncio.run(run_tests())
     
     print()
     print("=" * 60)
@@ -1,34 +1,133 @@
 """Trade monitoring and whale detection logic."""
-import time
-from typing import Dict, List, Optional, Set
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from cachetools import TTLCache
 from kalshi_client import KalshiClient
+from seen_tracker import SeenTracker, tracker
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on in-flight get_market requests
+MAX_CONCURRENT_MARKET_LOOKUPS = 8
+
+# Market details are refreshed at most once per TTL so tweets show
+# current titles/prices, and the cache never grows past its max size
+MARKET_CACHE_SIZE = 2000
+MARKET_CACHE_TTL_SECONDS = 60
+
+
+def compute_trade_metrics(
+    count: int,
+    yes_price: int,
+    no_price: int,
+    side_is_yes: bool
+) -> Tuple[int, float, float]:
+    """Compute a trade's value and price from primitive fields.
+    
+    Args:
+        count: Number of contracts
+        yes_price: Yes price in cents
+        no_price: No price in cents
+        side_is_yes: True if the taker bought YES
+        
+    Returns:
+        Tuple (value_cents, value_dollars, price_pct)
+    """
+    # Contracts are typically $1 each, price is in cents
+    price_cents = yes_price if side_is_yes else no_price
+    value_cents = count * price_cents
+    return value_cents, value_cents / 100, price_cents / 100
 
 
 class Trade:
     """Represents a trade on Kalshi."""
     
+    # Fixed attribute layout: no per-instance __dict__ on the trade hot path
+    __slots__ = (
+        'trade_id', 'ticker', 'side', 'count', 'yes_price', 'no_price',
+        'created_time', 'value_cents', 'value_dollars', 'price_pct'
+    )
+    
     def __init__(self, data: Dict):
         """Initialize trade from API data.
         
         Args:
             data: Trade data from Kalshi API
         """
-        self.trade_id = data.get('trade_id', '')
-        self.ticker = data.get('ticker', '')
-        self.side = data.get('taker_side', '')  # 'yes' or 'no' - FIXED: use 'taker_side' not 'side'
-        self.count = data.get('count', 0)  # Number of contracts
-        self.yes_price = data.get('yes_price', 0)  # Price in cents
-        self.no_price = data.get('no_price', 0)  # Price in cents
-        self.created_time = data.get('created_time', '')
-        
-        # Calculate trade value in dollars
-        # Contracts are typically $1 each, price is in cents
-        if self.side == 'yes':
-            self.value_cents = self.count * self.yes_price
-        else:
-            self.value_cents = self.count * self.no_price
-        
-        self.value_dollars = self.value_cents / 100
+        self._set_fields(
+            data.get('trade_id', ''),
+            data.get('ticker', ''),
+            data.get('taker_side', ''),  # 'yes' or 'no' - FIXED: use 'taker_side' not 'side'
+            data.get('count', 0),  # Number of contracts
+            data.get('yes_price', 0),  # Price in cents
+            data.get('no_price', 0),  # Price in cents
+            data.get('created_time', '')
+        )
+    
+    @classmethod
+    def from_fields(
+        cls,
+        trade_id: str,
+        ticker: str,
+        side: str,
+        count: int,
+        yes_price: int,
+        no_price: int,
+        created_time: str
+    ) -> 'Trade':
+        """Build a trade from already-extracted fields.
+        
+        Lets the WebSocket client create trades straight from its messages
+        without first rebuilding them as REST-shaped dicts.
+        
+        Args:
+            trade_id: Trade ID
+            ticker: Market ticker
+            side: Taker side ('yes' or 'no')
+            count: Number of contracts
+            yes_price: Yes price in cents
+            no_price: No price in cents
+            created_time: ISO timestamp
+            
+        Returns:
+            Trade object
+        """
+        trade = cls.__new__(cls)
+        trade._set_fields(trade_id, ticker, side, count, yes_price, no_price, created_time)
+        return trade
+    
+    def _set_fields(self, trade_id, ticker, side, count, yes_price, no_price, created_time):
+        """Assign trade fields and derive the trade metrics."""
+        self.trade_id = trade_id
+        self.ticker = ticker
+        self.side = side
+        self.count = count
+        self.yes_price = yes_price
+        self.no_price = no_price
+        self.created_time = created_time
+        
+        # Calculate trade value in dollars and the taker's price as a percentage
+        self.value_cents, self.value_dollars, self.price_pct = compute_trade_metrics(
+            count, yes_price, no_price, side == 'yes'
+        )
+    
+    @staticmethod
+    def raw_value_cents(data: Dict) -> int:
+        """Compute a trade's value in cents straight from API data.
+        
+        Lets batch callers filter rows without building Trade objects.
+        
+        Args:
+            data: Trade data from Kalshi API
+            
+        Returns:
+            Trade value in cents
+        """
+        if data.get('taker_side') == 'yes':
+            return data.get('count', 0) * data.get('yes_price', 0)
+        return data.get('count', 0) * data.get('no_price', 0)
     
     def is_whale(self, threshold_dollars: int) -> bool:
         """Check if trade is a whale trade.
@@ -48,20 +147,27 @@ class Trade:
 class TradeMonitor:
     """Monitors Kalshi for whale trades."""
     
-    def __init__(self, kalshi_client: KalshiClient, threshold_dollars: int = 100000):
+    def __init__(
+        self,
+        kalshi_client: KalshiClient,
+        threshold_dollars: int = 100000,
+        seen_tracker: SeenTracker = tracker
+    ):
         """Initialize trade monitor.
         
         Args:
             kalshi_client: Authenticated Kalshi client
             threshold_dollars: Minimum trade value for whale detection
+            seen_tracker: Seen trade IDs (defaults to the process-wide tracker)
         """
         self.kalshi_client = kalshi_client
         self.threshold_dollars = threshold_dollars
-        self.seen_trade_ids: Set[str] = set()
-        self.market_cache: Dict[str, Dict] = {}
+        self.seen_trades = seen_tracker
+        self.market_cache: TTLCache = TTLCache(maxsize=MARKET_CACHE_SIZE, ttl=MARKET_CACHE_TTL_SECONDS)
+        self._market_sem = asyncio.Semaphore(MAX_CONCURRENT_MARKET_LOOKUPS)
     
-    def get_market_details(self, ticker: str) -> Optional[Dict]:
-        """Get market details with caching.
+    async def get_market_details(self, ticker: str) -> Optional[Dict]:
+        """Get market details with short-lived caching.
         
         Args:
             ticker: Market ticker
@@ -69,92 +175,102 @@ class TradeMonitor:
         Returns:
             Market details or None
         """
-        if ticker not in self.market_cache:
-            market = self.kalshi_client.get_market(ticker)
+        market = self.market_cache.get(ticker)
+        if market is None:
+            async with self._market_sem:
+                market = await self.kalshi_client.get_market(ticker)
             if market:
                 self.market_cache[ticker] = market
         
-        return self.market_cache.get(ticker)
+        return market
     
-    def fetch_recent_trades(self, limit: int = 100) -> List[Trade]:
+    async def fetch_recent_trades(self, limit: int = 100, whales_only: bool = False) -> List[Trade]:
         """Fetch recent trades from Kalshi.
         
         Args:
             limit: Maximum number of trades to fetch
+            whales_only: Only return trades at or above the whale threshold
             
         Returns:
             List of Trade objects
         """
-        trades_data = self.kalshi_client.get_trades(limit=limit)
+        trades_data = await self.kalshi_client.get_trades(limit=limit)
         
         if not trades_data:
             return []
         
+        if whales_only:
+            # Filter the whole batch on raw values first so Trade objects
+            # are only built for the (rare) rows that pass
+            threshold_cents = self.threshold_dollars * 100
+            trades_data = [
+                trade_data for trade_data in trades_data
+                if Trade.raw_value_cents(trade_data) >= threshold_cents
+            ]
+        
         trades = []
         for trade_data in trades_data:
             try:
                 trade = Trade(trade_data)
                 trades.append(trade)
             except Exception as e:
-                print(f"Error parsing trade: {str(e)}")
+                logger.error("Error parsing trade: %s", e)
         
         return trades
     
-    def find_new_whale_trades(self) -> List[tuple[Trade, Dict]]:
+    async def find_new_whale_trades(self) -> List[tuple[Trade, Dict]]:
         """Find new whale trades that haven't been seen before.
         
         Returns:
             List of tuples (Trade, market_details) for new whale trades
         """
-        trades = self.fetch_recent_trades()
+        # Non-whale rows are dropped on their raw values: they never get a
+        # Trade object and never need to be remembered for dedup
+        trades = await self.fetch_recent_trades(whales_only=True)
         new_whales = []
         
-        for trade in trades:
-            # Skip if we've already seen this trade
-            if trade.trade_id in self.seen_trade_ids:
-                continue
-            
-            # Mark as seen
-            self.seen_trade_ids.add(trade.trade_id)
-            
-            # Check if it's a whale trade
-            if trade.is_whale(self.threshold_dollars):
-                market_details = self.get_market_details(trade.ticker)
-                if market_details:
-                    new_whales.append((trade, market_details))
-                    print(f"Found whale trade: {trade}")
-        
-        # Prevent memory leak by limiting seen trades to last 10000
-        if len(self.seen_trade_ids) > 10000:
-            # Convert to list, keep last 5000, convert back to set
-            self.seen_trade_ids = set(list(self.seen_trade_ids)[-5000:])
+        # Skip trades we've already seen, marking the rest as seen
+        whale_trades = [trade for trade in trades if self.seen_trades.add(trade.trade_id)]
+        
+        # Look up all whale markets concurrently (one request per ticker)
+        tickers = list(dict.fromkeys(trade.ticker for trade in whale_trades))
+        markets = dict(zip(
+            tickers,
+            await asyncio.gather(*(self.get_market_details(t) for t in tickers))
+        ))
+        
+        for trade in whale_trades:
+            market_details = markets[trade.ticker]
+            if market_details:
+                new_whales.append((trade, market_details))
+                logger.info("Found whale trade: %s", trade)
         
         return new_whales
     
-    def start_monitoring(self, check_interval: int = 60):
-        """Start continuous monitoring (blocking).
+    async def start_monitoring(self, check_interval: int = 60):
+        """Start continuous monitoring.
         
         Args:
             check_interval: Seconds between checks
         """
-        print(f"Starting trade monitoring (checking every {check_interval}s)")
-        print(f"Whale threshold: ${self.threshold_dollars:,}")
+        logger.info("Starting trade monitoring (checking every %ss)", check_interval)
+        logger.info("Whale threshold: $%s", f"{self.threshold_dollars:,}")
         
         while True:
             try:
-                whale_trades = self.find_new_whale_trades()
+                whale_trades = await self.find_new_whale_trades()
                 
                 if whale_trades:
-                    print(f"Found {len(whale_trades)} new whale trade(s)")
+                    logger.info("Found %d new whale trade(s)", len(whale_trades))
                     # Caller will handle posting to X
                     return whale_trades
                 
-                time.sleep(check_interval)
+                await asyncio.sleep(check_interval)
                 
             except KeyboardInterrupt:
-                print("\nMonitoring stopped by user")
+                logger.info("Monitoring stopped by user")
                 break
             except Exception as e:
-                print(f"Error during monitoring: {str(e)}")
-                time.sleep(check_interval)
+                logger.error("Error during monitoring: %s", e)
+                await asyncio.sleep(check_interval)
 
@@ -1,8 +1,71 @@
 """Format whale trades into user-friendly tweets."""
+from functools import lru_cache
 from typing import Dict
 from trade_monitor import Trade
 
 
+# Tweet layouts, filled in with str.format_map
+_WHALE_TEMPLATE = (
+    "🐋 Whale Alert!\n"
+    "\n"
+    "{value} trade on {title}\n"
+    "\n"
+    "📊 {contracts} {side} contracts @ {price_cents}¢ ({price_pct}%)\n"
+    "\n"
+    "@Kalshi @KalshiEco\n"
+    "\n"
+    "{url}"
+)
+_COMPACT_TEMPLATE = (
+    "🐋 {value} whale trade\n"
+    "{contracts} {side} contracts @ {price_cents}¢\n"
+    "@Kalshi @KalshiEco\n"
+    "{url}"
+)
+_SUMMARY_TEMPLATE = (
+    "🐋 {whale_count} whale trade{plural} detected!\n"
+    "\n"
+    "Total volume: {value}\n"
+    "\n"
+    "Big money moving on @Kalshi @KalshiEco 💰"
+)
+
+MAX_TWEET_LENGTH = 280
+
+# One-pass cleanup for market text: drop zero-width spaces, turn
+# non-breaking spaces into plain ones
+_CLEAN_TABLE = str.maketrans({'\u200b': None, '\xa0': ' '})
+
+# Whale template split around the title: head and tail are rendered once,
+# and the (possibly truncated) title is spliced in between
+_WHALE_HEAD, _WHALE_TAIL = _WHALE_TEMPLATE.split("{title}")
+
+
+# Currency formats indexed by magnitude: 0 = under $1K, 1 = $1K+, 2 = $1M+
+_CURRENCY_FORMATS = (
+    lambda amount: f"${amount:.0f}",
+    lambda amount: f"${amount / 1_000:.0f}K",
+    lambda amount: f"${amount / 1_000_000:.1f}M",
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_currency_cents(cents: int) -> str:
+    """Format a whole-cent dollar amount with K/M suffix (memoized).
+    
+    Trade values are exact integer cents, so keying the cache on cents
+    keeps output identical to formatting the float directly.
+    
+    Args:
+        cents: Amount in cents
+        
+    Returns:
+        Formatted string (e.g., "$125K", "$1.2M")
+    """
+    amount = cents / 100
+    return _CURRENCY_FORMATS[(amount >= 1_000) + (amount >= 1_000_000)](amount)
+
+
 class TweetFormatter:
     """Formats whale trades for posting on X."""
     
@@ -16,14 +79,10 @@ class TweetFormatter:
         Returns:
             Formatted string (e.g., "$125K", "$1.2M")
         """
-        if amount >= 1_000_000:
-            return f"${amount / 1_000_000:.1f}M"
-        elif amount >= 1_000:
-            return f"${amount / 1_000:.0f}K"
-        else:
-            return f"${amount:.0f}"
+        return _format_currency_cents(round(amount * 100))
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_market_url(ticker: str) -> str:
         """Get URL for a market on Kalshi.
         
@@ -47,59 +106,37 @@ class TweetFormatter:
             Formatted tweet text
         """
         # Extract market information
-        title = market.get('title', 'Unknown Market')
-        ticker = trade.ticker
+        title = market.get('title', 'Unknown Market').translate(_CLEAN_TABLE)
         
-        # Format the trade details
-        side = trade.side.upper()
-        value = TweetFormatter.format_currency(trade.value_dollars)
-        contracts = f"{trade.count:,}"
-        
-        # Calculate the price percentage
+        # Taker's price in cents (percentage comes precomputed on the trade)
         if trade.side == 'yes':
             price_cents = trade.yes_price
         else:
             price_cents = trade.no_price
-        price_pct = price_cents / 100  # Convert cents to percentage
-        
-        # Build the tweet
-        # Format: 🐋 Whale Alert! [Value] trade on [Market]
-        # Details: [Contracts] contracts at [Price]¢ ([Side])
-        # @Kalshi @KalshiEco
-        # [Link]
         
-        tweet_parts = [
-            f"🐋 Whale Alert!",
-            f"",
-            f"{value} trade on {title}",
-            f"",
-            f"📊 {contracts} {side} contracts @ {price_cents}¢ ({price_pct:.0f}%)",
-            f"",
-            f"@Kalshi @KalshiEco",
-            f"",
-            TweetFormatter.get_market_url(ticker)
-        ]
+        fields = {
+            'side': trade.side.upper(),
+            'value': TweetFormatter.format_currency(trade.value_dollars),
+            'contracts': f"{trade.count:,}",
+            'price_cents': str(price_cents),
+            'price_pct': f"{trade.price_pct:.0f}",
+            'url': TweetFormatter.get_market_url(trade.ticker),
+        }
         
-        tweet = "\n".join(tweet_parts)
+        head = _WHALE_HEAD.format_map(fields)
+        tail = _WHALE_TAIL.format_map(fields)
         
-        # Check length and truncate title if needed
-        if len(tweet) > 280:
+        # Room left for the title once everything else is rendered
+        title_budget = MAX_TWEET_LENGTH - len(head) - len(tail)
+        if len(title) > title_budget:
             # Truncate title to make it fit
-            max_title_len = len(title) - (len(tweet) - 280) - 3  # -3 for "..."
-            if max_title_len > 20:
-                truncated_title = title[:max_title_len] + "..."
-                tweet = tweet.replace(title, truncated_title)
-            else:
+            max_title_len = title_budget - 3  # -3 for "..."
+            if max_title_len <= 20:
                 # If still too long, use a more compact format
-                tweet_parts = [
-                    f"🐋 {value} whale trade",
-                    f"{contracts} {side} contracts @ {price_cents}¢",
-                    f"@Kalshi @KalshiEco",
-                    TweetFormatter.get_market_url(ticker)
-                ]
-                tweet = "\n".join(tweet_parts)
+                return _COMPACT_TEMPLATE.format_map(fields)
+            title = title[:max_title_len] + "..."
         
-        return tweet
+        return head + title + tail
     
     @staticmethod
     def format_summary_tweet(whale_count: int, total_value: float) -> str:
@@ -112,15 +149,9 @@ class TweetFormatter:
         Returns:
             Formatted summary tweet
         """
-        value = TweetFormatter.format_currency(total_value)
-        
-        tweet = (
-            f"🐋 {whale_count} whale trade{'s' if whale_count > 1 else ''} detected!\n"
-            f"\n"
-            f"Total volume: {value}\n"
-            f"\n"
-            f"Big money moving on @Kalshi @KalshiEco 💰"
-        )
-        
-        return tweet
+        return _SUMMARY_TEMPLATE.format_map({
+            'whale_count': whale_count,
+            'plural': 's' if whale_count > 1 else '',
+            'value': TweetFormatter.format_currency(total_value),
+        })
 
@@ -1,10 +1,35 @@
 """WebSocket client for real-time Kalshi trade data."""
 import asyncio
-import json
+import logging
+import orjson
 import time
+import uvloop
 import websockets
-from typing import Callable, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional
 from kalshi_client import KalshiClient
+from trade_monitor import Trade
+
+
+logger = logging.getLogger(__name__)
+
+# Keepalive handled by the websockets library
+PING_INTERVAL_SECONDS = 20
+PING_TIMEOUT_SECONDS = 10
+
+# Incoming frames buffered before the library stops reading from the socket
+MAX_QUEUED_MESSAGES = 256
+
+
+@lru_cache(maxsize=1024)
+def _ts_to_iso(ts: int) -> str:
+    """Convert unix seconds to a UTC ISO timestamp (memoized).
+    
+    Trades in a burst mostly share the same second, so this is usually
+    a cache hit.
+    """
+    return datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
 
 
 class KalshiWebSocketClient:
@@ -21,38 +46,92 @@ class KalshiWebSocketClient:
         self.websocket = None
         self.running = False
         self.trade_callback: Optional[Callable] = None
+        self.connect_callback: Optional[Callable] = None
         self.reconnect_delay = 1  # Start with 1 second
         self.max_reconnect_delay = 60  # Max 60 seconds
         
+        # The parsed key and PSS padding live on the Kalshi client; keep a
+        # bound signer so reconnects only build the timestamped message
+        self._sign = kalshi_client._sign_message
+        self._sign_suffix = "GET/trade-api/ws/v2"
+        self._api_key_id = kalshi_client.api_key_id
+        
+        # The subscribe command never changes, so serialize it once
+        self._subscribe_frame = orjson.dumps({
+            "id": 1,
+            "cmd": "subscribe",
+            "params": {
+                "channels": ["trade"]
+            }
+        })
+        
     def on_trade(self, callback: Callable):
         """Set callback for trade events.
         
         Args:
-            callback: Function to call with trade data
+            callback: Function to call with each Trade; awaited inline on
+                the receive loop, so it should hand slow work off
         """
         self.trade_callback = callback
+        self._invoke_trade = self._as_async(callback)
+    
+    def on_connect(self, callback: Callable):
+        """Set callback for (re)connect events.
+        
+        Called after every successful connect + subscribe, so callers can
+        backfill trades missed while the socket was down.
+        
+        Args:
+            callback: Function to call with no arguments
+        """
+        self.connect_callback = callback
+        self._invoke_connect = self._as_async(callback)
+    
+    @staticmethod
+    def _as_async(callback: Callable) -> Callable[..., Awaitable]:
+        """Wrap a callback so it can always be awaited.
+        
+        The sync/async check happens once here, at registration, instead
+        of on every message.
+        
+        Args:
+            callback: Sync or async callable
+            
+        Returns:
+            Async callable with the same arguments
+        """
+        if asyncio.iscoroutinefunction(callback):
+            return callback
+        
+        async def invoke(*args):
+            return callback(*args)
+        
+        return invoke
     
     async def connect(self):
         """Connect to Kalshi WebSocket."""
         try:
             # Generate auth headers (same as REST API)
-            timestamp = str(int(time.time() * 1000))
-            msg_string = timestamp + "GET" + "/trade-api/ws/v2"
-            signature = self.kalshi_client._sign_message(msg_string)
+            timestamp = str(time.time_ns() // 1_000_000)
+            signature = self._sign(timestamp + self._sign_suffix)
             
             headers = {
-                'KALSHI-ACCESS-KEY': self.kalshi_client.api_key_id,
+                'KALSHI-ACCESS-KEY': self._api_key_id,
                 'KALSHI-ACCESS-SIGNATURE': signature,
                 'KALSHI-ACCESS-TIMESTAMP': timestamp
             }
             
-            # Connect to WebSocket
-            print("Connecting to Kalshi WebSocket...")
+            # Connect to WebSocket; the library runs keepalive pings in the
+            # background and closes the connection if a pong is missed
+            logger.info("Connecting to Kalshi WebSocket...")
             self.websocket = await websockets.connect(
                 self.ws_url,
-                additional_headers=headers
+                additional_headers=headers,
+                ping_interval=PING_INTERVAL_SECONDS,
+                ping_timeout=PING_TIMEOUT_SECONDS,
+                max_queue=MAX_QUEUED_MESSAGES
             )
-            print("✓ Connected to WebSocket")
+            logger.info("✓ Connected to WebSocket")
             
             # Subscribe to trade channel
             await self.subscribe_to_trades()
@@ -60,27 +139,23 @@ class KalshiWebSocketClient:
             # Reset reconnect delay on successful connection
             self.reconnect_delay = 1
             
+            if self.connect_callback:
+                await self._run_connect_callback()
+            
             return True
             
         except Exception as e:
-            print(f"Failed to connect to WebSocket: {str(e)}")
+            logger.error("Failed to connect to WebSocket: %s", e)
             return False
     
     async def subscribe_to_trades(self):
         """Subscribe to trade updates."""
-        subscribe_msg = {
-            "id": 1,
-            "cmd": "subscribe",
-            "params": {
-                "channels": ["trade"]
-            }
-        }
-        
         try:
-            await self.websocket.send(json.dumps(subscribe_msg))
-            print("✓ Subscribed to trade channel")
+            # Pre-encoded UTF-8 bytes, sent as a text frame
+            await self.websocket.send(self._subscribe_frame, text=True)
+            logger.info("✓ Subscribed to trade channel")
         except Exception as e:
-            print(f"Failed to subscribe: {str(e)}")
+            logger.error("Failed to subscribe: %s", e)
     
     async def listen(self):
         """Listen for WebSocket messages."""
@@ -91,7 +166,7 @@ class KalshiWebSocketClient:
                 if not self.websocket:
                     if not await self.connect():
                         # Exponential backoff
-                        print(f"Reconnecting in {self.reconnect_delay}s...")
+                        logger.warning("Reconnecting in %ss...", self.reconnect_delay)
                         await asyncio.sleep(self.reconnect_delay)
                         self.reconnect_delay = min(
                             self.reconnect_delay * 2,
@@ -99,30 +174,20 @@ class KalshiWebSocketClient:
                         )
                         continue
                 
-                # Receive message
-                message = await asyncio.wait_for(
-                    self.websocket.recv(),
-                    timeout=30.0
-                )
+                # Receive message (a dead connection raises ConnectionClosed);
+                # raw bytes skip the UTF-8 decode, orjson parses them directly
+                message = await self.websocket.recv(decode=False)
                 
                 # Parse and handle message
-                data = json.loads(message)
+                data = orjson.loads(message)
                 await self.handle_message(data)
                 
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    await self.websocket.ping()
-                except:
-                    print("Connection lost, reconnecting...")
-                    self.websocket = None
-                    
             except websockets.exceptions.ConnectionClosed:
-                print("WebSocket connection closed, reconnecting...")
+                logger.warning("WebSocket connection closed, reconnecting...")
                 self.websocket = None
                 
             except Exception as e:
-                print(f"WebSocket error: {str(e)}")
+                logger.error("WebSocket error: %s", e)
                 await asyncio.sleep(1)
     
     async def handle_message(self, data: dict):
@@ -134,68 +199,71 @@ class KalshiWebSocketClient:
         msg_type = data.get('type')
         
         if msg_type == 'trade':
-            # Trade update - normalize format to match REST API
+            # Trade update - build the Trade directly from the WebSocket fields
             trade_data = data.get('msg', {})
             
-            # Convert WebSocket format to REST API format
-            normalized_trade = {
-                'trade_id': trade_data.get('trade_id'),
-                'ticker': trade_data.get('market_ticker'),  # Key difference!
-                'taker_side': trade_data.get('taker_side'),
-                'count': trade_data.get('count'),
-                'yes_price': trade_data.get('yes_price'),
-                'no_price': trade_data.get('no_price'),
-                'created_time': self._timestamp_to_iso(trade_data.get('ts', 0))
-            }
-            
             if self.trade_callback:
-                # Run callback in thread pool to avoid blocking
-                asyncio.create_task(self._run_callback(normalized_trade))
+                get = trade_data.get
+                trade = Trade.from_fields(
+                    get('trade_id'),
+                    get('market_ticker'),  # Key difference!
+                    get('taker_side'),
+                    get('count', 0),
+                    get('yes_price', 0),
+                    get('no_price', 0),
+                    self._timestamp_to_iso(get('ts', 0))
+                )
+                # Awaited inline: no Task per message; the callback itself
+                # offloads anything slow
+                await self._run_callback(trade)
                 
         elif msg_type == 'subscribed':
             channel = data.get('msg', {}).get('channel', 'unknown')
-            print(f"✓ Subscription confirmed: {channel}")
+            logger.info("✓ Subscription confirmed: %s", channel)
             
         elif msg_type == 'error':
-            print(f"WebSocket error: {data.get('msg')}")
+            logger.error("WebSocket error: %s", data.get('msg'))
     
     def _timestamp_to_iso(self, ts: int) -> str:
         """Convert unix timestamp to ISO format.
         
         Args:
-            ts: Unix timestamp
+            ts: Unix timestamp (seconds)
             
         Returns:
-            ISO format timestamp string
+            ISO format timestamp string (UTC)
         """
-        from datetime import datetime
-        return datetime.fromtimestamp(ts).isoformat() + 'Z'
+        return _ts_to_iso(ts)
     
-    async def _run_callback(self, trade_data: dict):
+    async def _run_callback(self, trade: Trade):
         """Run trade callback in async context.
         
         Args:
-            trade_data: Trade data from WebSocket
+            trade: Trade from WebSocket
         """
         try:
-            if asyncio.iscoroutinefunction(self.trade_callback):
-                await self.trade_callback(trade_data)
-            else:
-                self.trade_callback(trade_data)
+            await self._invoke_trade(trade)
+        except Exception as e:
+            logger.error("Error in trade callback: %s", e)
+    
+    async def _run_connect_callback(self):
+        """Run connect callback in async context."""
+        try:
+            await self._invoke_connect()
         except Exception as e:
-            print(f"Error in trade callback: {str(e)}")
+            logger.error("Error in connect callback: %s", e)
     
     async def close(self):
         """Close WebSocket connection."""
         self.running = False
         if self.websocket:
             await self.websocket.close()
-            print("WebSocket connection closed")
+            logger.info("WebSocket connection closed")
     
     def run_forever(self):
         """Run WebSocket client (blocking)."""
         try:
-            asyncio.run(self.listen())
+            uvloop.run(self.listen())
         except KeyboardInterrupt:
-            print("\nStopping WebSocket client...")
+            logger.info("Stopping WebSocket client...")
 
@@ -0,0 +1,318 @@
+"""Shared whale trade handling for the WebSocket-driven bots."""
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from cachetools import TTLCache
+
+from config import Config
+from kalshi_client import KalshiClient
+from x_client import XClient
+from trade_monitor import (
+    Trade,
+    MARKET_CACHE_SIZE,
+    MARKET_CACHE_TTL_SECONDS,
+    MAX_CONCURRENT_MARKET_LOOKUPS,
+)
+from tweet_formatter import TweetFormatter
+from rate_limiter import RateLimiter
+from seen_tracker import SeenTracker, tracker
+
+
+logger = logging.getLogger(__name__)
+
+# Whale trades waiting to be posted; beyond this, new ones are dropped
+POST_QUEUE_SIZE = 100
+
+# Whale tweets in flight at once (still bounded by the rate limiter)
+POSTER_CONCURRENCY = 4
+
+# Whales queued within this window of the first one are posted together
+# as a single summary tweet
+COALESCE_WINDOW_SECONDS = 0.5
+
+# X posting allowance: TWEET_RATE_LIMIT tweets per TWEET_RATE_WINDOW_SECONDS
+TWEET_RATE_LIMIT = 300
+TWEET_RATE_WINDOW_SECONDS = 3 * 3600
+
+
+class WhaleHandler:
+    """Detects whale trades and posts them to X."""
+    
+    def __init__(
+        self,
+        kalshi_client: KalshiClient,
+        x_client: XClient,
+        seen_tracker: SeenTracker = tracker
+    ):
+        """Initialize the handler.
+        
+        Args:
+            kalshi_client: Authenticated Kalshi client (market lookups)
+            x_client: Authenticated X client (posting)
+            seen_tracker: Seen trade IDs (defaults to the process-wide tracker)
+        """
+        self.kalshi_client = kalshi_client
+        self.x_client = x_client
+        
+        # Initialize tweet formatter
+        self.tweet_formatter = TweetFormatter()
+        
+        # Track seen trades to avoid duplicates (shared with TradeMonitor)
+        self.seen_trades = seen_tracker
+        
+        # Market details cache (size-bounded, entries expire after the TTL)
+        self.market_cache = TTLCache(maxsize=MARKET_CACHE_SIZE, ttl=MARKET_CACHE_TTL_SECONDS)
+        self._market_sem = asyncio.Semaphore(MAX_CONCURRENT_MARKET_LOOKUPS)
+        
+        # In-flight whale lookups started from handle_trade (strong refs
+        # so they are not garbage collected mid-flight)
+        self._whale_tasks: Set[asyncio.Task] = set()
+        
+        # Whale trades are handed to run_poster() so X API calls never
+        # hold up trade handling
+        self._post_queue: asyncio.Queue = asyncio.Queue(maxsize=POST_QUEUE_SIZE)
+        # Coalesced batches of whale trades, one tweet each
+        self._batch_queue: asyncio.Queue = asyncio.Queue(maxsize=POST_QUEUE_SIZE)
+        self.rate_limiter = RateLimiter(
+            rate=TWEET_RATE_LIMIT / TWEET_RATE_WINDOW_SECONDS,
+            max_tokens=TWEET_RATE_LIMIT
+        )
+    
+    async def handle_trade(self, trade: Trade):
+        """Handle incoming trade from WebSocket.
+        
+        Runs inline on the WebSocket receive loop, so only the cheap dedup
+        and whale check happen here; the market lookup for a whale runs
+        as its own task.
+        
+        Args:
+            trade: Trade from WebSocket
+        """
+        try:
+            if self._is_new_whale(trade):
+                task = asyncio.create_task(self._dispatch_whale(trade))
+                self._whale_tasks.add(task)
+                task.add_done_callback(self._whale_tasks.discard)
+        except Exception as e:
+            logger.error("Error handling trade: %s", e)
+    
+    async def process_trade(self, trade: Trade) -> bool:
+        """Run a single trade through dedup, whale detection and posting.
+        
+        Args:
+            trade: Trade object (from WebSocket or REST)
+        
+        Returns:
+            True if the trade was a new whale trade
+        """
+        if not self._is_new_whale(trade):
+            return False
+        
+        await self._dispatch_whale(trade)
+        return True
+    
+    def _is_new_whale(self, trade: Trade) -> bool:
+        """Mark a trade as seen and check whether it is a new whale trade.
+        
+        Args:
+            trade: Trade object
+        
+        Returns:
+            True if the trade was unseen and meets the whale threshold
+        """
+        # Skip if we've seen this trade
+        if not self.seen_trades.add(trade.trade_id):
+            return False
+        
+        # Log all trades (for monitoring); formatted only if DEBUG is enabled
+        logger.debug("Trade: %s | $%.2f | %s", trade.ticker, trade.value_dollars, trade.side)
+        
+        # Check if it's a whale trade
+        if not trade.is_whale(Config.WHALE_THRESHOLD_DOLLARS):
+            return False
+        
+        logger.info("🐋 WHALE DETECTED: %s", trade)
+        return True
+    
+    async def _dispatch_whale(self, trade: Trade):
+        """Fetch market details for a whale trade and queue it for posting.
+        
+        Args:
+            trade: Whale trade
+        """
+        try:
+            # Get market details
+            market = await self.get_market_details(trade.ticker)
+            
+            if market:
+                # Queue for posting to X
+                self.queue_whale_trade(trade, market)
+            else:
+                logger.warning("Could not fetch market details for %s", trade.ticker)
+        except Exception as e:
+            logger.error("Error handling whale trade %s: %s", trade, e)
+    
+    def mark_seen(self, trades: Iterable[Trade]):
+        """Mark trades as seen without posting them.
+        
+        Used on startup so trades that happened before the bot was
+        launched are not tweeted again.
+        
+        Args:
+            trades: Trades to mark as seen
+        """
+        for trade in trades:
+            self.seen_trades.add(trade.trade_id)
+    
+    async def backfill(self, trades: Iterable[Trade]):
+        """Process trades fetched over REST (e.g. after a reconnect).
+        
+        Args:
+            trades: Trades to process, oldest or newest first
+        """
+        trades = list(trades)
+        
+        # Warm the market cache for every unseen whale concurrently so
+        # the loop below never waits on serial lookups
+        tickers = {
+            trade.ticker for trade in trades
+            if trade.trade_id not in self.seen_trades
+            and trade.is_whale(Config.WHALE_THRESHOLD_DOLLARS)
+        }
+        await asyncio.gather(*(self.get_market_details(t) for t in tickers))
+        
+        for trade in trades:
+            try:
+                await self.process_trade(trade)
+            except Exception as e:
+                logger.error("Error handling trade: %s", e)
+    
+    async def get_market_details(self, ticker: str) -> Optional[Dict]:
+        """Get market details with short-lived caching.
+        
+        Args:
+            ticker: Market ticker
+        
+        Returns:
+            Market details or None
+        """
+        market = self.market_cache.get(ticker)
+        if market is None:
+            async with self._market_sem:
+                market = await self.kalshi_client.get_market(ticker)
+            if market:
+                self.market_cache[ticker] = market
+        
+        return market
+    
+    def queue_whale_trade(self, trade: Trade, market: Dict):
+        """Queue a whale trade for posting without waiting on X.
+        
+        Args:
+            trade: Trade object
+            market: Market details
+        """
+        try:
+            self._post_queue.put_nowait((trade, market))
+        except asyncio.QueueFull:
+            logger.warning("Post queue full, dropping whale trade: %s", trade)
+    
+    async def run_poster(self):
+        """Post queued whale trades to X until cancelled.
+        
+        A coalescer groups whales arriving close together into batches,
+        and POSTER_CONCURRENCY workers post the batches concurrently
+        instead of one round trip at a time.
+        """
+        await asyncio.gather(
+            self._coalesce_worker(),
+            *(self._post_worker() for _ in range(POSTER_CONCURRENCY))
+        )
+    
+    async def _coalesce_worker(self):
+        """Group queued whale trades into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._post_queue.get()]
+            
+            # Keep collecting until the window since the first whale closes
+            deadline = loop.time() + COALESCE_WINDOW_SECONDS
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    batch.append(await asyncio.wait_for(self._post_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            for _ in batch:
+                self._post_queue.task_done()
+            
+            try:
+                self._batch_queue.put_nowait(batch)
+            except asyncio.QueueFull:
+                logger.warning("Post queue full, dropping %d whale trade(s)", len(batch))
+    
+    async def _post_worker(self):
+        """Post coalesced batches one at a time until cancelled."""
+        while True:
+            batch = await self._batch_queue.get()
+            try:
+                # Rate limiting: bursts allowed, sustained rate capped
+                await self.rate_limiter.wait_for_token()
+                if len(batch) == 1:
+                    await self.post_whale_trade(*batch[0])
+                else:
+                    await self.post_summary(batch)
+            finally:
+                self._batch_queue.task_done()
+    
+    async def post_whale_trade(self, trade: Trade, market: Dict):
+        """Post whale trade to X.
+        
+        Args:
+            trade: Trade object
+            market: Market details
+        """
+        try:
+            # Format the tweet
+            tweet_text = self.tweet_formatter.format_whale_tweet(trade, market)
+            
+            logger.info("Posting tweet for %s:\n%s", trade.ticker, tweet_text)
+            
+            await self._post_tweet(tweet_text)
+        
+        except Exception as e:
+            logger.error("Error posting whale trade: %s", e)
+    
+    async def post_summary(self, batch: List[Tuple[Trade, Dict]]):
+        """Post one summary tweet for a burst of whale trades.
+        
+        Args:
+            batch: (Trade, market details) pairs queued together
+        """
+        try:
+            tweet_text = self.tweet_formatter.format_summary_tweet(
+                len(batch),
+                sum(trade.value_dollars for trade, _ in batch)
+            )
+            
+            logger.info("Posting summary tweet for %d whale trades:\n%s", len(batch), tweet_text)
+            
+            await self._post_tweet(tweet_text)
+        
+        except Exception as e:
+            logger.error("Error posting whale summary: %s", e)
+    
+    async def _post_tweet(self, tweet_text: str):
+        """Post formatted tweet text to X and log the outcome.
+        
+        Args:
+            tweet_text: Tweet text
+        """
+        # Post to X (async client, other posts proceed concurrently)
+        tweet_id = await self.x_client.post_tweet_async(tweet_text)
+        
+        if tweet_id:
+            logger.info("✓ Tweet posted successfully (ID: %s)", tweet_id)
+        else:
+            logger.error("✗ Failed to post tweet")
@@ -1,6 +1,37 @@
 """X (Twitter) API client for posting tweets."""
+import logging
+import httpx
+import orjson
 import tweepy
+from oauthlib.oauth1 import Client as OAuth1Client
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool for the Tweepy session (connections to api.x.com)
+HTTP_POOL_SIZE = 4
+
+# X API v2 create-tweet endpoint (used by post_tweet_async)
+TWEETS_URL = "https://api.x.com/2/tweets"
+
+
+def _fit_tweet(text: str) -> str:
+    """Truncate tweet text to the 280 character limit.
+    
+    Args:
+        text: Tweet text
+        
+    Returns:
+        Text of at most 280 characters
+    """
+    # Ensure tweet is within character limit (measured once)
+    if (length := len(text)) <= 280:
+        return text
+    logger.warning("Tweet truncated from %d to 280 characters", length)
+    return text[:277] + "..."
 
 
 class XClient:
@@ -27,6 +58,24 @@ class XClient:
             access_token=access_token,
             access_token_secret=access_token_secret
         )
+        
+        # Reuse pooled TLS connections across calls. urllib3 does not retry
+        # POST by default, so a tweet is never sent twice
+        self.client.session.mount("https://", HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        
+        # Async posting: OAuth 1.0a user-context signing plus one shared
+        # HTTP/2 connection, so concurrent posts multiplex over it
+        self._oauth = OAuth1Client(
+            api_key,
+            client_secret=api_secret,
+            resource_owner_key=access_token,
+            resource_owner_secret=access_token_secret
+        )
+        self.session = httpx.AsyncClient(http2=True, timeout=10.0)
     
     def post_tweet(self, text: str) -> Optional[str]:
         """Post a tweet.
@@ -38,28 +87,62 @@ class XClient:
             Tweet ID if successful, None otherwise
         """
         try:
-            # Ensure tweet is within character limit
-            if len(text) > 280:
-                print(f"Warning: Tweet truncated from {len(text)} to 280 characters")
-                text = text[:277] + "..."
-            
-            response = self.client.create_tweet(text=text)
+            response = self.client.create_tweet(text=_fit_tweet(text))
             
             if response and response.data:
                 tweet_id = response.data['id']
-                print(f"Tweet posted successfully: ID {tweet_id}")
+                logger.info("Tweet posted successfully: ID %s", tweet_id)
                 return tweet_id
             else:
-                print("Tweet posted but no ID returned")
+                logger.warning("Tweet posted but no ID returned")
                 return None
                 
         except tweepy.TweepyException as e:
-            print(f"Error posting tweet: {str(e)}")
+            logger.error("Error posting tweet: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error posting tweet: {str(e)}")
+            logger.error("Unexpected error posting tweet: %s", e)
+            return None
+    
+    async def post_tweet_async(self, text: str) -> Optional[str]:
+        """Post a tweet without blocking the event loop.
+        
+        Args:
+            text: Tweet text (max 280 characters)
+            
+        Returns:
+            Tweet ID if successful, None otherwise
+        """
+        try:
+            # JSON bodies are not part of the OAuth 1.0a signature base string
+            _, headers, _ = self._oauth.sign(TWEETS_URL, http_method='POST')
+            headers['Content-Type'] = 'application/json'
+            
+            response = await self.session.post(
+                TWEETS_URL,
+                headers=headers,
+                content=orjson.dumps({'text': _fit_tweet(text)})
+            )
+            
+            if response.status_code != 201:
+                logger.error("Error posting tweet: %s - %s", response.status_code, response.text)
+                return None
+            
+            tweet_id = orjson.loads(response.content).get('data', {}).get('id')
+            if tweet_id:
+                logger.info("Tweet posted successfully: ID %s", tweet_id)
+            else:
+                logger.warning("Tweet posted but no ID returned")
+            return tweet_id
+            
+        except Exception as e:
+            logger.error("Unexpected error posting tweet: %s", e)
             return None
     
+    async def close(self):
+        """Close the async HTTP connection pool."""
+        await self.session.aclose()
+    
     def test_connection(self) -> bool:
         """Test connection to X API.
         
@@ -69,10 +152,10 @@ class XClient:
         try:
             me = self.client.get_me()
             if me and me.data:
-                print(f"Connected to X as: @{me.data.username}")
+                logger.info("Connected to X as: @%s", me.data.username)
                 return True
             return False
         except Exception as e:
-            print(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed: %s", e)
             return False
 